@@ -2,26 +2,37 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import json
 import os
+import reprlib
+import sys
 from settings_window import SettingsWindow
 
 
 class ObjectBrowser:
     """Layout Editor / Object Browser"""
 
-    def __init__(self, root, settings=None):
+    def __init__(self, root, settings=None, target=None):
         self.window = root
         self.window.title("Layout Editor")
 
+        # Object shown at the top of the tree
+        self.target = target if target is not None else sys.modules["__main__"]
+
+        # Tree item -> (parent item, key, object) and item -> fingerprint
+        self.nodes = {}
+        self.fingerprints = {}
+        self.refresh_job = None
+        self.shown_item = None
+
         # Load settings
         self.settings = settings or self.load_settings()
         self.settings_win = None
 
-        # Apply loaded settings
-        self.apply_settings()
-
-        # Build UI
+        # Build UI (settings below need the widgets to exist)
         self.create_ui()
 
+        # Apply loaded settings (also fills the tree)
+        self.apply_settings()
+
     # ---------------------------------------------------------
     # UI CREATION
     # ---------------------------------------------------------
@@ -42,9 +53,307 @@ class ObjectBrowser:
             command=self.reload_settings
         ).pack(side=tk.LEFT, padx=2)
 
+        paned = ttk.PanedWindow(self.window, orient=tk.HORIZONTAL)
+        paned.pack(fill=tk.BOTH, expand=True)
+
+        # Object tree
+        tree_frame = ttk.Frame(paned)
+        paned.add(tree_frame, weight=1)
+
+        scrollbar = ttk.Scrollbar(tree_frame)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.tree = ttk.Treeview(
+            tree_frame,
+            columns=("type", "value"),
+            yscrollcommand=scrollbar.set
+        )
+        self.tree.heading("#0", text="Name")
+        self.tree.heading("type", text="Type")
+        self.tree.heading("value", text="Value")
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.config(command=self.tree.yview)
+
+        self.tree.bind("<<TreeviewOpen>>", self.on_tree_open)
+        self.tree.bind("<<TreeviewSelect>>", self.on_tree_select)
+        self.window.bind("<Destroy>", self.on_destroy, add="+")
+
         # Example content area
-        self.content = tk.Text(self.window)
-        self.content.pack(fill=tk.BOTH, expand=True)
+        self.content = tk.Text(paned)
+        paned.add(self.content, weight=3)
+
+    # ---------------------------------------------------------
+    # OBJECT TREE
+    # ---------------------------------------------------------
+
+    def populate_tree(self):
+        """Rebuild the tree from the target object."""
+        for item in self.tree.get_children():
+            self.tree.delete(item)
+        self.nodes.clear()
+        self.fingerprints.clear()
+        self.shown_item = None
+        self.fingerprints[""] = self.fingerprint(self.target)
+
+        for key, child in self.get_children(self.target):
+            self.insert_node("", key, child)
+
+    def get_children(self, obj):
+        """Return (key, value) pairs shown under obj."""
+        show_private = self.settings.get("browser", {}).get("show_private", False)
+
+        try:
+            if isinstance(obj, dict):
+                pairs = list(obj.items())
+            elif isinstance(obj, (list, tuple)):
+                pairs = list(enumerate(obj))
+            elif hasattr(obj, "__dict__"):
+                pairs = list(vars(obj).items())
+            else:
+                return []
+        except Exception:
+            return []
+
+        if not show_private:
+            pairs = [
+                (k, v) for k, v in pairs
+                if not (isinstance(k, str) and k.startswith("_"))
+            ]
+
+        # Leave the browser out of its own tree: its bookkeeping grows
+        # with every row shown, so auto refresh would never settle.
+        own = (self, self.nodes, self.fingerprints, self.tree)
+        return [
+            (k, v) for k, v in pairs
+            if not any(v is o for o in own)
+        ]
+
+    def resolve_child(self, obj, key):
+        """Look up key on obj the same way get_children enumerated it."""
+        if isinstance(obj, (dict, list, tuple)):
+            return obj[key]
+        return vars(obj)[key]
+
+    def has_children(self, obj):
+        """Cheap check for whether obj is worth an expand arrow."""
+        try:
+            if isinstance(obj, (dict, list, tuple)):
+                return len(obj) > 0
+            if hasattr(obj, "__dict__"):
+                return bool(vars(obj))
+        except Exception:
+            pass
+        return False
+
+    def insert_node(self, parent, key, obj, index="end"):
+        item = self.tree.insert(parent, index, text=str(key))
+        self.nodes[item] = (parent, key, obj)
+        self.update_row(item, obj)
+        return item
+
+    def remove_node(self, item):
+        self.forget_node(item)
+        self.tree.delete(item)
+
+    def draw_row(self, item, obj):
+        """Redraw the values of a single row, leaving its children alone."""
+        self.fingerprints[item] = self.fingerprint(obj)
+        self.tree.item(
+            item,
+            values=(type(obj).__name__, reprlib.repr(obj))
+        )
+        if item == self.shown_item:
+            self.show_content(item)
+
+    def update_row(self, item, obj):
+        """Redraw a single row and reset its (unexpanded) children."""
+        self.draw_row(item, obj)
+
+        for child in self.tree.get_children(item):
+            self.remove_node(child)
+
+        # Placeholder so the expand arrow shows; filled in on open
+        if self.depth(item) < self.max_depth and self.has_children(obj):
+            self.tree.insert(item, "end", text="...")
+
+    def forget_node(self, item):
+        for child in self.tree.get_children(item):
+            self.forget_node(child)
+        self.nodes.pop(item, None)
+        self.fingerprints.pop(item, None)
+
+    def depth(self, item):
+        level = 0
+        while item:
+            item = self.tree.parent(item)
+            level += 1
+        return level
+
+    def expand_node(self, item):
+        """Replace the placeholder with the real children of item."""
+        for child in self.tree.get_children(item):
+            self.remove_node(child)
+
+        obj = self.nodes[item][2]
+        for key, child in self.get_children(obj):
+            self.insert_node(item, key, child)
+
+    def on_tree_open(self, event=None):
+        item = self.tree.focus()
+        if item not in self.nodes:
+            return
+
+        children = self.tree.get_children(item)
+        if children and all(child in self.nodes for child in children):
+            # Already expanded once; keep nested rows open
+            obj = self.nodes[item][2]
+            self.sync_children(item, obj)
+            self.refresh_children(item, obj)
+        else:
+            self.expand_node(item)
+        self.check_shown_item()
+
+    def on_tree_select(self, event=None):
+        selection = self.tree.selection()
+        if not selection or selection[0] not in self.nodes:
+            return
+
+        self.show_content(selection[0])
+
+    def show_content(self, item):
+        """Show the full repr of item's object in the content area."""
+        self.shown_item = item
+        obj = self.nodes[item][2]
+        self.content.delete("1.0", tk.END)
+        try:
+            self.content.insert("1.0", repr(obj))
+        except Exception as e:
+            self.content.insert("1.0", f"<repr failed: {e}>")
+
+    def check_shown_item(self):
+        """Clear the content area if its row has been removed."""
+        if self.shown_item is not None and self.shown_item not in self.nodes:
+            self.shown_item = None
+            self.content.delete("1.0", tk.END)
+
+    # ---------------------------------------------------------
+    # AUTO REFRESH
+    # ---------------------------------------------------------
+
+    @staticmethod
+    def fingerprint(obj):
+        """Cheap change marker: identity, type, size and version counter."""
+        # Same dispatch as get_children, so size tracks the rows shown
+        try:
+            if isinstance(obj, (dict, list, tuple)):
+                size = len(obj)
+            elif hasattr(obj, "__dict__"):
+                size = len(vars(obj))
+            else:
+                size = len(obj)
+        except Exception:
+            size = None
+
+        try:
+            version = getattr(obj, "_version", None)
+        except Exception:
+            version = None
+        if not isinstance(version, (int, float, str)):
+            version = None
+
+        return (id(obj), type(obj), size, version)
+
+    def start_auto_refresh(self):
+        self.stop_auto_refresh()
+        if self.auto_refresh:
+            self.refresh_job = self.window.after(
+                self.refresh_interval, self.auto_refresh_tick
+            )
+
+    def stop_auto_refresh(self):
+        if self.refresh_job is not None:
+            self.window.after_cancel(self.refresh_job)
+            self.refresh_job = None
+
+    def on_destroy(self, event=None):
+        # <Destroy> on the root also fires for every child widget
+        if event is None or event.widget is self.window:
+            self.auto_refresh = False
+            self.stop_auto_refresh()
+
+    def auto_refresh_tick(self):
+        self.refresh_job = None
+        try:
+            self.refresh_visible()
+        finally:
+            self.start_auto_refresh()
+
+    def refresh_visible(self):
+        """Update rows whose fingerprint changed.
+
+        Only top-level rows and children of expanded rows are checked;
+        collapsed subtrees are never walked.
+        """
+        if self.fingerprint(self.target) != self.fingerprints.get(""):
+            self.fingerprints[""] = self.fingerprint(self.target)
+            self.sync_children("", self.target)
+        self.refresh_children("", self.target)
+        self.check_shown_item()
+
+    def refresh_children(self, parent, parent_obj):
+        for item in self.tree.get_children(parent):
+            # Skip placeholders and rows dropped by sync_children below
+            if item not in self.nodes:
+                continue
+
+            _, key, old_obj = self.nodes[item]
+            try:
+                obj = self.resolve_child(parent_obj, key)
+            except Exception:
+                # Keys were swapped without the parent's size changing
+                self.sync_children(parent, parent_obj)
+                continue
+
+            old_print = self.fingerprints.get(item)
+            new_print = self.fingerprint(obj)
+            if new_print == old_print:
+                if self.tree.item(item, "open"):
+                    self.refresh_children(item, obj)
+                continue
+
+            self.nodes[item] = (parent, key, obj)
+            is_open = self.tree.item(item, "open")
+
+            if not is_open or old_print is None or new_print[1] != old_print[1]:
+                # Type changed: rebuild the row from scratch
+                self.update_row(item, obj)
+                if is_open:
+                    self.expand_node(item)
+                if self.shown_item is not None and self.shown_item not in self.nodes:
+                    self.tree.selection_set(item)
+                    self.show_content(item)
+            else:
+                # Same type (possibly a replacement object): children are
+                # looked up again by key, so open rows stay open
+                self.draw_row(item, obj)
+                self.sync_children(item, obj)
+                self.refresh_children(item, obj)
+
+    def sync_children(self, parent, parent_obj):
+        """Add and remove child rows so they match parent_obj, in order."""
+        pairs = self.get_children(parent_obj)
+        keys = {key for key, _ in pairs}
+
+        existing = set()
+        for item in self.tree.get_children(parent):
+            if item in self.nodes and self.nodes[item][1] in keys:
+                existing.add(self.nodes[item][1])
+            else:
+                self.remove_node(item)
+
+        for index, (key, child) in enumerate(pairs):
+            if key not in existing:
+                self.insert_node(parent, key, child, index)
 
     # ---------------------------------------------------------
     # SETTINGS WINDOW INTEGRATION
@@ -96,6 +405,24 @@ class ObjectBrowser:
         except Exception:
             self.max_depth = 6
 
+        # Browser auto refresh
+        browser = self.settings.get("browser", {})
+        self.auto_refresh = bool(browser.get("auto_refresh", False))
+        try:
+            self.refresh_interval = max(
+                100, int(browser.get("refresh_interval_ms", 1000))
+            )
+        except Exception:
+            self.refresh_interval = 1000
+
+        # Filtering and depth changes need the tree rebuilt
+        tree_options = (browser.get("show_private", False), self.max_depth)
+        if hasattr(self, "tree") and tree_options != getattr(self, "tree_options", None):
+            self.tree_options = tree_options
+            self.populate_tree()
+
+        self.start_auto_refresh()
+
         # Example: font size
         font_size = self.settings.get("appearance", {}).get("font_size", 10)
         try:
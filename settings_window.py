@@ -44,6 +44,7 @@ class SettingsWindow:
                 "show_magic": True,
                 "expand_on_select": True,
                 "auto_refresh": False,
+                "refresh_interval_ms": 1000,
                 "search_case_sensitive": False
             },
             "display": {